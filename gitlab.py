@@ -1,29 +1,103 @@
+import copy
+import threading
+import time
 import tkinter as tk
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox,ttk
+from urllib.parse import urlsplit
 
+import numpy as np
 import requests
 
 gitlab_url = "https://gitlab.com"
 private_token = "Bearer ******"  # Your private token here
+gitlab_per_page = 100  # Largest page size allowed by the GitLab API
+
+# Seconds a GET result is shared with later identical requests
+request_cache_ttl = 10
+request_lock = threading.Lock()
+inflight_requests = {}
+response_cache = OrderedDict()  # Oldest entries first
+
+# Adaptive (AIMD) limit of concurrent requests, driven by GitLab's RateLimit headers
+request_timeout = 30  # Seconds before a request that gets no response is abandoned
+rate_limit_min_concurrency = 1
+rate_limit_max_concurrency = 32
+rate_limit_max_retries = 3
+rate_limit_low_remaining = 0.1  # Back off below this fraction of RateLimit-Limit
+rate_limit_latency_factor = 2.0  # Stop growing when latency exceeds this multiple of the recent lowest
+rate_limit_latency_samples = 50  # Number of recent latencies the lowest latency is taken from
+rate_limit_max_pause = 60  # Seconds, guards against clock skew in RateLimit-Reset
+rate_limit_throughput_window = 10  # Seconds
+rate_limiter = {
+    "condition": threading.Condition(),
+    "limit": 4.0,
+    "in_flight": 0,
+    "paused_until": 0.0,
+    "last_decrease": 0.0,
+    "latency": None,
+    "recent_latencies": deque(maxlen=rate_limit_latency_samples),
+    "completed": deque()
+}
+stop_requests = threading.Event()  # Set when the program exits, refuses new requests
+
+access_levels = {
+    "No access": 0,
+    "Minimal access": 5,
+    "Guest": 10,
+    "Reporter": 20,
+    "Developer": 30,
+    "Maintainer": 40,
+    "Owner": 50
+}
+
+# Cell geometry (in pixels) of the access matrix grid
+matrix_cell_width = 90
+matrix_cell_height = 22
+matrix_row_header_width = 180
+matrix_col_header_height = 40
+
+# Cell colors of the access matrix grid, keyed by access level
+matrix_level_colors = {
+    5: "#f2f2f2",
+    10: "#dbe9f6",
+    20: "#b7d4ee",
+    30: "#a8dcb0",
+    40: "#f7d58c",
+    50: "#f2a07b"
+}
 
 def show_all_projects():
     """
     Retrieve and display information about all projects from a GitLab instance.
 
     This function fetches a list of all projects from the GitLab instance using
-    the `get_all_projects` function and displays their IDs and names in a text widget.
+    the `get_all_projects` function in the background with `run_in_background`, and displays
+    their IDs and names in a text widget with `display_all_projects`.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    run_in_background(get_all_projects, display_all_projects, gitlab_url, private_token, executor=request_executor)
+
+def display_all_projects(all_projects):
+    """
+    Display the result of the `show_all_projects` request.
 
     If projects are successfully retrieved, the text widget is enabled and populated
     with project information. If retrieval fails, an error message is displayed using
     a message box.
 
     Args:
-        None
+        all_projects: The result of `get_all_projects`.
 
     Returns:
         None
     """
-    all_projects = get_all_projects(gitlab_url, private_token)
     if all_projects:
         result_text.config(state=tk.NORMAL)
         result_text.delete(1.0, tk.END)
@@ -39,19 +113,31 @@ def show_all_groups():
     Retrieve and display information about all groups from a GitLab instance.
 
     This function fetches a list of all groups from the GitLab instance using
-    the `get_all_groups` function and displays their IDs and names in a text widget.
+    the `get_all_groups` function in the background with `run_in_background`, and displays
+    their IDs and names in a text widget with `display_all_groups`.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    run_in_background(get_all_groups, display_all_groups, gitlab_url, private_token, executor=request_executor)
+
+def display_all_groups(all_groups):
+    """
+    Display the result of the `show_all_groups` request.
 
     If groups are successfully retrieved, the text widget is enabled and populated
     with group information. If retrieval fails, an error message is displayed using
     a message box.
 
     Args:
-        None
+        all_groups: The result of `get_all_groups`.
 
     Returns:
         None
     """
-    all_groups = get_all_groups(gitlab_url, private_token)
     if all_groups:
         result_text.config(state=tk.NORMAL)
         result_text.delete(1.0, tk.END)
@@ -66,8 +152,8 @@ def view_access_levels():
     """
     Display a list of GitLab access levels along with their corresponding numeric values.
 
-    This function creates a dictionary of GitLab access levels and their corresponding
-    numeric values. It then generates a formatted string containing the access level names
+    This function uses the module-level `access_levels` dictionary of GitLab access levels
+    and their corresponding numeric values. It generates a formatted string containing the access level names
     and their numeric values, separated by newlines. Finally, it displays a message box
     with the title "Access Levels" and the formatted access level information.
 
@@ -77,15 +163,6 @@ def view_access_levels():
     Returns:
         None
     """
-    access_levels = {
-        "No access": 0,
-        "Minimal access": 5,
-        "Guest": 10,
-        "Reporter": 20,
-        "Developer": 30,
-        "Maintainer": 40,
-        "Owner": 50
-    }
     access_list_str = "\n".join([f"{access}: ({value})" for access, value in access_levels.items()])
     messagebox.showinfo("Access Levels", access_list_str)
 
@@ -96,18 +173,32 @@ def show_unique_usernames():
 
     This function retrieves information about all projects with associated user
     usernames from a GitLab instance using the `get_all_projects_with_users` function.
-    If projects with users are successfully retrieved, it enables the text widget
+    The crawl runs in the background with `run_in_background`, so the window stays
+    responsive, and its result is displayed by `display_unique_usernames`.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    run_in_background(get_all_projects_with_users, display_unique_usernames, gitlab_url, private_token)
+
+def display_unique_usernames(projects_with_users):
+    """
+    Display the result of the `show_unique_usernames` crawl.
+
+    If projects with users were successfully retrieved, it enables the text widget
     (`result_text`), clears its contents, and inserts a list of unique usernames
     along with their project associations. Finally, it disables the text widget if
     projects with users were retrieved, or displays an error message using a message box.
 
     Args:
-        None
+        projects_with_users: The result of `get_all_projects_with_users`.
 
     Returns:
         None
     """
-    projects_with_users = get_all_projects_with_users(gitlab_url, private_token)
     if projects_with_users:
         result_text.config(state=tk.NORMAL)
         result_text.delete(1.0, tk.END)
@@ -121,19 +212,470 @@ def show_unique_usernames():
     else:
         messagebox.showerror("Error", "Failed to retrieve projects or project members.")
 
+def show_access_matrix():
+    """
+    Display the users x projects access level matrix in a scrollable grid window.
+
+    This function builds the access level matrix in the background using the
+    `get_access_level_matrix` function and `run_in_background`, so the window stays
+    responsive during the crawl, then displays it with `display_access_matrix`.
+
+    :param None
+    :return: None
+    """
+    run_in_background(get_access_level_matrix, display_access_matrix, gitlab_url, private_token)
+
+def display_access_matrix(matrix):
+    """
+    Display an access level matrix in a scrollable grid window.
+
+    This function opens a new window with a canvas-based grid. The grid is virtualized:
+    only the cells that fit in the window are fetched with `get_access_level_window` and
+    drawn, and they are redrawn whenever the grid is scrolled or resized. Row headers show
+    each user's highest access level and column headers show each project's number of Owners.
+    Projects whose members could not be retrieved are counted in the summary and shown
+    with an unknown number of Owners, so that a failed crawl is not mistaken for No access.
+
+    :param matrix: The access level matrix returned by `get_access_level_matrix`, or None.
+    :type matrix: dict or None
+    :return: None
+    """
+    if not matrix:
+        messagebox.showerror("Error", "Failed to retrieve projects or project members.")
+        return
+
+    usernames = matrix["usernames"]
+    projects = matrix["projects"]
+    max_levels = max_access_level_per_user(matrix)
+    owner_counts = count_owners_per_project(matrix)
+    level_names = {value: access for access, value in access_levels.items()}
+    view = {"row": 0, "col": 0}
+
+    window = tk.Toplevel(root)
+    window.title("Access Level Matrix")
+
+    failed_count = int(np.count_nonzero(matrix["failed"]))
+    summary_label = tk.Label(window, text=f"{len(usernames)} users x {len(projects)} projects, "
+                                          f"{matrix['levels'].size} memberships")
+    if failed_count:
+        summary_label.config(text=f"{summary_label['text']} - failed to retrieve the members of "
+                                  f"{failed_count} projects", fg="red")
+        messagebox.showwarning("Warning", f"Failed to retrieve the members of {failed_count} projects. "
+                                          "Their access levels are missing from the matrix.", parent=window)
+    summary_label.grid(row=0, column=0, columnspan=2, sticky="w", padx=5, pady=5)
+
+    canvas = tk.Canvas(window, width=900, height=500, background="white", highlightthickness=0)
+    canvas.grid(row=1, column=0, sticky="nsew")
+    y_scrollbar = tk.Scrollbar(window, orient=tk.VERTICAL)
+    y_scrollbar.grid(row=1, column=1, sticky="ns")
+    x_scrollbar = tk.Scrollbar(window, orient=tk.HORIZONTAL)
+    x_scrollbar.grid(row=2, column=0, sticky="ew")
+    window.rowconfigure(1, weight=1)
+    window.columnconfigure(0, weight=1)
+
+    def visible_counts():
+        visible_rows = max(1, (canvas.winfo_height() - matrix_col_header_height) // matrix_cell_height)
+        visible_cols = max(1, (canvas.winfo_width() - matrix_row_header_width) // matrix_cell_width)
+        return visible_rows, visible_cols
+
+    def redraw(event=None):
+        visible_rows, visible_cols = visible_counts()
+        view["row"] = max(0, min(view["row"], len(usernames) - visible_rows))
+        view["col"] = max(0, min(view["col"], len(projects) - visible_cols))
+        row_stop = min(len(usernames), view["row"] + visible_rows)
+        col_stop = min(len(projects), view["col"] + visible_cols)
+        block = get_access_level_window(matrix, view["row"], row_stop, view["col"], col_stop)
+
+        canvas.delete("all")
+        for j, col in enumerate(range(view["col"], col_stop)):
+            x = matrix_row_header_width + j * matrix_cell_width
+            owners = "?" if matrix["failed"][col] else owner_counts[col]
+            canvas.create_text(x + 4, 4, anchor="nw", width=matrix_cell_width - 8,
+                               text=f"{projects[col][:12]}\nOwners: {owners}")
+        for i, row in enumerate(range(view["row"], row_stop)):
+            y = matrix_col_header_height + i * matrix_cell_height
+            canvas.create_text(4, y + 4, anchor="nw",
+                               text=f"{usernames[row][:16]} ({level_names.get(int(max_levels[row]), max_levels[row])})")
+            for j in np.flatnonzero(block[i]):
+                level = int(block[i, j])
+                x = matrix_row_header_width + j * matrix_cell_width
+                canvas.create_rectangle(x, y, x + matrix_cell_width, y + matrix_cell_height,
+                                        fill=matrix_level_colors.get(level, "#dddddd"), outline="white")
+                canvas.create_text(x + 4, y + 4, anchor="nw", text=level_names.get(level, level))
+
+        y_scrollbar.set(*scroll_fractions(view["row"], visible_rows, len(usernames)))
+        x_scrollbar.set(*scroll_fractions(view["col"], visible_cols, len(projects)))
+
+    def scroll_fractions(start, visible, total):
+        if total == 0:
+            return 0.0, 1.0
+        return start / total, min(1.0, (start + visible) / total)
+
+    def scroll(axis, total, visible_index, *args):
+        visible = visible_counts()[visible_index]
+        if args[0] == "moveto":
+            view[axis] = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = visible if args[2] == "pages" else 1
+            view[axis] += int(args[1]) * step
+        redraw()
+
+    def on_mousewheel(event):
+        if event.num == 4 or event.delta > 0:
+            view["row"] -= 3
+        else:
+            view["row"] += 3
+        redraw()
+
+    y_scrollbar.config(command=lambda *args: scroll("row", len(usernames), 0, *args))
+    x_scrollbar.config(command=lambda *args: scroll("col", len(projects), 1, *args))
+    canvas.bind("<Configure>", redraw)
+    canvas.bind("<MouseWheel>", on_mousewheel)
+    canvas.bind("<Button-4>", on_mousewheel)
+    canvas.bind("<Button-5>", on_mousewheel)
+
+# Rate-limited requests
+def gitlab_request(method, api_url, **kwargs):
+    """
+    Send a request to the GitLab API through the adaptive concurrency limiter.
+
+    Every API request of the program goes through this function. It waits for a free
+    slot of the limiter before sending the request, reports the response and its latency
+    back to the limiter with `update_rate_limit`, and retries requests rejected with
+    HTTP 429 (Too Many Requests) up to `rate_limit_max_retries` times, once the limiter's
+    pause has elapsed. Requests time out after `request_timeout` seconds unless a
+    `timeout` argument is given, so a hung connection cannot hold a slot forever.
+
+    :param method: The HTTP method, e.g. "get" or "post".
+    :type method: str
+    :param api_url: The URL of the API endpoint.
+    :type api_url: str
+    :param kwargs: Additional arguments passed to `requests.request`.
+    :return: The response of the request.
+    :rtype: requests.Response
+    :raises requests.exceptions.RequestException: If the request cannot be sent.
+    """
+    kwargs.setdefault("timeout", request_timeout)
+    for attempt in range(rate_limit_max_retries + 1):
+        acquire_request_slot()
+        response = None
+        start = time.monotonic()
+        try:
+            response = requests.request(method, api_url, **kwargs)
+        finally:
+            release_request_slot(response, time.monotonic() - start)
+        if response.status_code != 429 or attempt == rate_limit_max_retries:
+            return response
+
+def acquire_request_slot():
+    """
+    Block until the limiter allows one more request in flight, then take the slot.
+
+    :param None
+    :return: None
+    :raises requests.exceptions.RequestException: If `stop_requests` is set.
+    """
+    with rate_limiter["condition"]:
+        while True:
+            if stop_requests.is_set():
+                raise requests.exceptions.RequestException("Requests stopped, the program is exiting")
+            pause = rate_limiter["paused_until"] - time.time()
+            if pause > 0:
+                rate_limiter["condition"].wait(pause)
+            elif rate_limiter["in_flight"] < int(rate_limiter["limit"]):
+                break
+            else:
+                rate_limiter["condition"].wait()
+        rate_limiter["in_flight"] += 1
+
+def release_request_slot(response, latency):
+    """
+    Give back a request slot and adjust the limiter from the finished request.
+
+    :param response: The response of the request, or None if it could not be sent.
+    :type response: requests.Response or None
+    :param latency: The duration of the request in seconds.
+    :type latency: float
+    :return: None
+    """
+    with rate_limiter["condition"]:
+        rate_limiter["in_flight"] -= 1
+        update_rate_limit(response, latency)
+        rate_limiter["condition"].notify_all()
+
+def update_rate_limit(response, latency):
+    """
+    Adjust the number of requests allowed in flight (AIMD).
+
+    The limit is increased additively, by about one request per round of completed
+    requests, while responses are healthy and the average latency stays below
+    `rate_limit_latency_factor` times the lowest of the last `rate_limit_latency_samples`
+    latencies; a higher latency holds the limit where it is. The limit is halved, at most
+    once per average latency, when GitLab rejects a request (HTTP 429), when
+    `RateLimit-Remaining` falls below `rate_limit_low_remaining` of `RateLimit-Limit`, or
+    when the request fails. Once the remaining budget is used up by the requests already in flight,
+    new requests are paused until `Retry-After` or `RateLimit-Reset`, for at most
+    `rate_limit_max_pause` seconds; a pause is only ever extended, never shortened.
+    Must be called with the limiter's condition held.
+
+    :param response: The response of the request, or None if it could not be sent.
+    :type response: requests.Response or None
+    :param latency: The duration of the request in seconds.
+    :type latency: float
+    :return: None
+    """
+    now = time.monotonic()
+    rate_limiter["completed"].append(now)
+    while rate_limiter["completed"][0] < now - rate_limit_throughput_window:
+        rate_limiter["completed"].popleft()
+    if rate_limiter["latency"] is None:
+        rate_limiter["latency"] = latency
+    else:
+        rate_limiter["latency"] = 0.8 * rate_limiter["latency"] + 0.2 * latency
+    rate_limiter["recent_latencies"].append(latency)
+
+    throttled = response is None or response.status_code == 429
+    slow = rate_limiter["latency"] > rate_limit_latency_factor * min(rate_limiter["recent_latencies"])
+    if response is not None:
+        remaining = parse_header_int(response.headers.get("RateLimit-Remaining"))
+        budget = parse_header_int(response.headers.get("RateLimit-Limit"))
+        if remaining is not None and budget:
+            throttled = throttled or remaining < rate_limit_low_remaining * budget
+        if response.status_code == 429 or (remaining is not None and remaining <= rate_limiter["in_flight"]):
+            retry_after = parse_header_int(response.headers.get("Retry-After"))
+            reset = parse_header_int(response.headers.get("RateLimit-Reset"))
+            if retry_after is not None:
+                pause = retry_after
+            elif reset is not None:
+                pause = reset - time.time()
+            else:
+                pause = 1
+            pause = min(max(pause, 0), rate_limit_max_pause)
+            rate_limiter["paused_until"] = max(rate_limiter["paused_until"], time.time() + pause)
+
+    if throttled:
+        if now - rate_limiter["last_decrease"] >= rate_limiter["latency"]:
+            rate_limiter["limit"] = max(rate_limit_min_concurrency, rate_limiter["limit"] / 2)
+            rate_limiter["last_decrease"] = now
+    elif not slow:
+        rate_limiter["limit"] = min(rate_limit_max_concurrency, rate_limiter["limit"] + 1 / rate_limiter["limit"])
+
+def parse_header_int(value):
+    """
+    Parse an integer response header value.
+
+    :param value: The header value.
+    :type value: str or None
+    :return: The integer value, or None if the header is missing or not an integer.
+    :rtype: int or None
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def get_request_stats():
+    """
+    Return the current state of the adaptive concurrency limiter.
+
+    :param None
+    :return: A dictionary with the allowed (`concurrency`) and current (`in_flight`) number of
+        requests in flight, the `throughput` in requests per second over the last
+        `rate_limit_throughput_window` seconds, and the average `latency` in seconds.
+    :rtype: dict
+    """
+    with rate_limiter["condition"]:
+        now = time.monotonic()
+        completed = sum(1 for t in rate_limiter["completed"] if t >= now - rate_limit_throughput_window)
+        return {
+            "concurrency": int(rate_limiter["limit"]),
+            "in_flight": rate_limiter["in_flight"],
+            "throughput": completed / rate_limit_throughput_window,
+            "latency": rate_limiter["latency"] or 0.0
+        }
+
+# Shared GET requests
+def gitlab_get_json(api_url, headers, params=None):
+    """
+    Send a GET request to the GitLab API and return its parsed JSON body.
+
+    Identical GET requests (same URL, query parameters and authorization) are coalesced:
+    while one is in flight, other callers wait for it and share its result or error
+    instead of sending their own request (unless a write invalidates it meanwhile, in
+    which case they send a fresh one), and a successful result is reused for
+    `request_cache_ttl` seconds afterwards. Writes sent through `gitlab_write` invalidate
+    the shared results of the resource they modify. Every caller receives a shallow copy
+    of the shared result, so the items it contains must be treated as read-only.
+
+    :param api_url: The URL of the API endpoint.
+    :type api_url: str
+    :param headers: The request headers, including the authorization header.
+    :type headers: dict
+    :param params: The query parameters of the request.
+    :type params: dict or None
+    :return: The parsed JSON body of the response.
+    :rtype: list or dict
+    :raises requests.exceptions.RequestException: If the request fails.
+    """
+    key = (api_url, tuple(sorted((params or {}).items())), headers.get("Authorization"))
+
+    while True:
+        with request_lock:
+            cached = response_cache.get(key)
+            if cached and time.monotonic() - cached[0] < request_cache_ttl:
+                return copy.copy(cached[1])
+            call = inflight_requests.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = {"event": threading.Event(), "result": None, "error": None, "stale": False}
+                inflight_requests[key] = call
+
+        if is_leader:
+            break
+        call["event"].wait()
+        if call["stale"]:
+            continue  # A write invalidated the shared request, its result may predate it
+        if call["error"] is not None:
+            raise call["error"]
+        return copy.copy(call["result"])
+
+    try:
+        response = gitlab_request("get", api_url, headers=headers, params=params)
+        response.raise_for_status()  # Check for any errors in the API response
+        call["result"] = response.json()
+        return copy.copy(call["result"])
+    except Exception as e:
+        call["error"] = e
+        raise
+    finally:
+        with request_lock:
+            if inflight_requests.get(key) is call:
+                del inflight_requests[key]
+            if call["error"] is None and not call["stale"]:
+                cache_response(key, call["result"])
+        call["event"].set()
+
+def cache_response(key, result):
+    """
+    Store a GET result in the response cache and evict the expired entries.
+
+    The entry is moved to the end of `response_cache`, so the cache stays ordered from
+    the oldest to the newest entry and expired entries are always found at its start.
+    Must be called with `request_lock` held.
+
+    :param key: The cache key of the request.
+    :type key: tuple
+    :param result: The parsed JSON body of the response.
+    :type result: list or dict
+    :return: None
+    """
+    now = time.monotonic()
+    response_cache.pop(key, None)
+    response_cache[key] = (now, result)
+    while response_cache and now - next(iter(response_cache.values()))[0] >= request_cache_ttl:
+        response_cache.popitem(last=False)
+
+# Paginated GET requests
+def gitlab_get_all_pages(api_url, headers, params=None):
+    """
+    Send GET requests for every page of a paginated GitLab API listing.
+
+    This function requests the listing `gitlab_per_page` items at a time through
+    `gitlab_get_json`, following the `page` parameter until a page comes back with
+    fewer items than requested, and returns the items of all pages.
+
+    :param api_url: The URL of the API endpoint.
+    :type api_url: str
+    :param headers: The request headers, including the authorization header.
+    :type headers: dict
+    :param params: The query parameters of the request, without `page` and `per_page`.
+    :type params: dict or None
+    :return: The items of all pages.
+    :rtype: list
+    :raises requests.exceptions.RequestException: If a request fails.
+    """
+    items = []
+    page = 1
+    while True:
+        page_params = {**(params or {}), "page": page, "per_page": gitlab_per_page}
+        page_items = gitlab_get_json(api_url, headers, params=page_params)
+        items.extend(page_items)
+        if len(page_items) < gitlab_per_page:
+            return items
+        page += 1
+
+# Write requests
+def gitlab_write(method, api_url, headers, json=None):
+    """
+    Send a write request (POST, PUT or DELETE) to the GitLab API.
+
+    After the request completes, successfully or not, the shared GET results of the
+    modified resource are invalidated: every cached or in-flight GET whose path lies
+    under the parent of `api_url` (e.g. `/projects/5/members` for a delete of
+    `/projects/5/members/7`) is re-fetched by its next caller. Writes to a group's
+    members also invalidate every `/members/all` listing, since projects and subgroups
+    inherit the group's members.
+
+    :param method: The HTTP method, e.g. "post" or "delete".
+    :type method: str
+    :param api_url: The URL of the API endpoint.
+    :type api_url: str
+    :param headers: The request headers, including the authorization header.
+    :type headers: dict
+    :param json: The JSON body of the request.
+    :type json: dict or None
+    :return: The response of the request.
+    :rtype: requests.Response
+    :raises requests.exceptions.RequestException: If the request cannot be sent.
+    """
+    path = urlsplit(api_url).path.rstrip("/")
+    try:
+        return gitlab_request(method, api_url, headers=headers, json=json)
+    finally:
+        invalidate_cached_requests(path.rsplit("/", 1)[0],
+                                   inherited_members="/groups/" in path and "/members" in path)
+
+def invalidate_cached_requests(path_prefix, inherited_members=False):
+    """
+    Drop the shared GET results of every resource under the given API path.
+
+    Cached results are removed, and GET requests currently in flight are detached so
+    that new callers send a fresh request and their (possibly stale) result is not cached.
+
+    :param path_prefix: The API path, e.g. "/api/v4/projects/5/members".
+    :type path_prefix: str
+    :param inherited_members: Whether to also drop every `/members/all` listing.
+    :type inherited_members: bool
+    :return: None
+    """
+    def is_affected(key):
+        path = urlsplit(key[0]).path.rstrip("/")
+        if inherited_members and path.endswith("/members/all"):
+            return True
+        return path == path_prefix or path.startswith(path_prefix + "/")
+
+    with request_lock:
+        for key in [key for key in response_cache if is_affected(key)]:
+            del response_cache[key]
+        for key in [key for key in inflight_requests if is_affected(key)]:
+            inflight_requests.pop(key)["stale"] = True
+
 # Get all projects
-def get_all_projects(gitlab_url, private_token):
+def get_all_projects(gitlab_url, private_token, all_pages=False):
     """
     Retrieve a list of all private projects from a GitLab instance.
 
     This function makes an API request to the specified GitLab instance's API endpoint
     to retrieve a list of all private projects. It uses the provided GitLab URL and
-    private token for authentication.
+    private token for authentication. Only the first page of the listing is retrieved
+    unless `all_pages` is set.
 
     :param gitlab_url: The base URL of the GitLab instance.
     :type gitlab_url: str
     :param private_token: The private token for authentication.
     :type private_token: str
+    :param all_pages: Whether to retrieve every page of the listing.
+    :type all_pages: bool
     :return: A list of project information in JSON format, or None if an error occurs.
     :rtype: list[dict] or None
     """
@@ -142,10 +684,9 @@ def get_all_projects(gitlab_url, private_token):
     params = {"visibility": "private"}  # Add this query parameter to filter private projects
 
     try:
-        response = requests.get(api_url, headers=headers, params=params)
-        response.raise_for_status()  # Check for any errors in the API response
-
-        return response.json()
+        if all_pages:
+            return gitlab_get_all_pages(api_url, headers, params=params)
+        return gitlab_get_json(api_url, headers, params=params)
     except requests.exceptions.RequestException as e:
         print(f"Error: {e}")
         return None
@@ -171,10 +712,7 @@ def get_all_groups(gitlab_url, private_token):
     params = {"visibility": "private"}  # Add this query parameter to filter private groups
 
     try:
-        response = requests.get(api_url, headers=headers, params=params)
-        response.raise_for_status()  # Check for any errors in the API response
-
-        return response.json()
+        return gitlab_get_json(api_url, headers, params=params)
     except requests.exceptions.RequestException as e:
         print(f"Error: {e}")
         return None
@@ -185,8 +723,8 @@ def add_member_to_group():
 
     This function retrieves input values from the GUI (Group ID, username, and access level),
     then calls the `add_member_to_group_by_username` function to add a member to the specified
-    GitLab group. It displays a success message if the member is added successfully, or an error
-    message if the operation fails.
+    GitLab group in the background. It displays a success message if the member is added
+    successfully, or an error message if the operation fails.
 
     :param None
     :return: None
@@ -195,12 +733,15 @@ def add_member_to_group():
     username = username_entry.get().strip()
     access_level = access_level_entry.get().strip()
 
-    if group_id and username and access_level:
-        added_member = add_member_to_group_by_username(group_id, username, access_level, gitlab_url, private_token)
+    def show_result(added_member):
         if added_member:
             messagebox.showinfo("Success", f"Added member to the group: {added_member['name']} - {added_member['username']}")
         else:
             messagebox.showerror("Error", "Failed to add member to the group.")
+
+    if group_id and username and access_level:
+        run_in_background(add_member_to_group_by_username, show_result, group_id, username, access_level,
+                          gitlab_url, private_token, executor=request_executor)
     else:
         messagebox.showerror("Error", "Invalid input. Please provide valid Group ID, username, and access level.")
 
@@ -210,8 +751,8 @@ def delete_group_member():
 
     This function retrieves input values from the GUI (Group ID and username),
     then calls the `delete_group_member_by_username` function to remove a member
-    from the specified GitLab group. It displays a success message if the member is
-    deleted successfully, or an error message if the operation fails.
+    from the specified GitLab group in the background. It displays a success message if
+    the member is deleted successfully, or an error message if the operation fails.
 
     :param None
     :return: None
@@ -219,11 +760,14 @@ def delete_group_member():
     group_id = group_id_entry.get().strip()
     username = username_entry.get().strip()
 
-    deleted_member = delete_group_member_by_username(group_id, username, gitlab_url, private_token)
-    if deleted_member:
-        messagebox.showinfo("Success", f"Deleted member from the group: {deleted_member['name']} - {deleted_member['username']}")
-    else:
-        messagebox.showerror("Error", "Member not found in the group.")
+    def show_result(deleted_member):
+        if deleted_member:
+            messagebox.showinfo("Success", f"Deleted member from the group: {deleted_member['name']} - {deleted_member['username']}")
+        else:
+            messagebox.showerror("Error", "Member not found in the group.")
+
+    run_in_background(delete_group_member_by_username, show_result, group_id, username,
+                      gitlab_url, private_token, executor=request_executor)
 
 # Add member to project
 def add_member_to_project():
@@ -232,8 +776,8 @@ def add_member_to_project():
 
     This function retrieves input values from the GUI (selected project, username, and access level),
     then calls the `add_member_to_project_by_username` function to add a member to the specified
-    GitLab project. It displays a success message if the member is added successfully, or an error
-    message if the operation fails.
+    GitLab project in the background. It displays a success message if the member is added
+    successfully, or an error message if the operation fails.
 
     :param None
     :return: None
@@ -243,12 +787,15 @@ def add_member_to_project():
     username = username_entry.get().strip()
     access_level = access_level_entry.get().strip()
 
-    if project_id and username and access_level:
-        added_member = add_member_to_project_by_username(project_id, username, access_level, gitlab_url, private_token)
+    def show_result(added_member):
         if added_member:
             messagebox.showinfo("Success", f"Added member to the project: {added_member['name']} - {added_member['username']}")
         else:
             messagebox.showerror("Error", "Failed to add member to the project.")
+
+    if project_id and username and access_level:
+        run_in_background(add_member_to_project_by_username, show_result, project_id, username, access_level,
+                          gitlab_url, private_token, executor=request_executor)
     else:
         messagebox.showerror("Error", "Invalid input. Please provide valid Project and username, and access level.")
 
@@ -258,8 +805,8 @@ def delete_project_member():
 
     This function retrieves input values from the GUI (selected project and username),
     then calls the `delete_project_member_by_username` function to remove a member
-    from the specified GitLab project. It displays a success message if the member is
-    deleted successfully, or an error message if the operation fails.
+    from the specified GitLab project in the background. It displays a success message if
+    the member is deleted successfully, or an error message if the operation fails.
 
     :param None
     :return: None
@@ -268,11 +815,14 @@ def delete_project_member():
     project_id = extract_project_id_from_dropdown(project_name_id)
     username = username_entry.get().strip()
 
-    deleted_member = delete_project_member_by_username(project_id, username, gitlab_url, private_token)
-    if deleted_member:
-        messagebox.showinfo("Success", f"Deleted member from the project: {deleted_member['name']} - {deleted_member['username']}")
-    else:
-        messagebox.showerror("Error", "Member not found in the project.")
+    def show_result(deleted_member):
+        if deleted_member:
+            messagebox.showinfo("Success", f"Deleted member from the project: {deleted_member['name']} - {deleted_member['username']}")
+        else:
+            messagebox.showerror("Error", "Member not found in the project.")
+
+    run_in_background(delete_project_member_by_username, show_result, project_id, username,
+                      gitlab_url, private_token, executor=request_executor)
 
 def get_all_projects_with_users(gitlab_url, private_token):
     """
@@ -280,7 +830,7 @@ def get_all_projects_with_users(gitlab_url, private_token):
 
     This function calls the `get_all_projects` function to retrieve a list of all projects
     from the GitLab instance using the provided GitLab URL and private token. It then iterates
-    through each project, retrieves a list of project members using the `list_project_members`
+    through each project, retrieves a list of project members using the `list_members_of_projects`
     function, and creates a dictionary containing project names as keys and sets of associated
     usernames as values.
 
@@ -297,16 +847,137 @@ def get_all_projects_with_users(gitlab_url, private_token):
 
     projects_with_users = {}
 
-    for project in all_projects:
-        project_id = project['id']
+    all_project_members = list_members_of_projects(all_projects, gitlab_url, private_token)
+    for project, project_members in zip(all_projects, all_project_members):
         project_name = project['name']
-        project_members = list_project_members(project_id, gitlab_url, private_token)
         if project_members:
             usernames = {member['username'] for member in project_members}
             projects_with_users[project_name] = list(usernames)
 
     return projects_with_users
 
+# Build the users x projects access level matrix
+def get_access_level_matrix(gitlab_url, private_token):
+    """
+    Retrieve a sparse users x projects matrix of access levels from a GitLab instance.
+
+    This function calls the `get_all_projects` function to retrieve every page of projects,
+    then crawls every page of the members of each project, including members inherited
+    from ancestor groups, using the `list_members_of_projects` function. Every membership
+    becomes one non-zero entry of the matrix (the highest level if a user is listed more
+    than once for a project), stored in coordinate form as NumPy arrays (`rows`, `cols`,
+    `levels`) sorted by their flat index `keys`, so that lookups and aggregates can be
+    computed with vectorized operations.
+
+    :param gitlab_url: The base URL of the GitLab instance.
+    :type gitlab_url: str
+    :param private_token: The private token for authentication.
+    :type private_token: str
+    :return: A dictionary with the `usernames` and `projects` labels, the `rows`, `cols`,
+        `levels` and `keys` arrays of the matrix and the `failed` array flagging the projects
+        whose members could not be retrieved, or None if an error occurs.
+    :rtype: dict or None
+    """
+    all_projects = get_all_projects(gitlab_url, private_token, all_pages=True)
+    if not all_projects:
+        return None
+
+    user_index = {}
+    project_names = []
+    rows = []
+    cols = []
+    levels = []
+    failed = []
+
+    all_project_members = list_members_of_projects(all_projects, gitlab_url, private_token,
+                                                   inherited=True, all_pages=True)
+    for project, project_members in zip(all_projects, all_project_members):
+        col = len(project_names)
+        project_names.append(project['name'])
+        failed.append(project_members is None)
+        for member in project_members or []:
+            rows.append(user_index.setdefault(member['username'], len(user_index)))
+            cols.append(col)
+            levels.append(member['access_level'])
+
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    levels = np.asarray(levels, dtype=np.uint8)
+    keys = rows * len(project_names) + cols
+    order = np.lexsort((levels, keys))
+    keys = keys[order]
+    # Keep only the highest level of each (user, project) cell
+    unique = np.ones(keys.size, dtype=bool)
+    unique[:-1] = keys[1:] != keys[:-1]
+    order = order[unique]
+
+    return {
+        "usernames": list(user_index),
+        "projects": project_names,
+        "rows": rows[order],
+        "cols": cols[order],
+        "levels": levels[order],
+        "keys": keys[unique],
+        "failed": np.asarray(failed, dtype=bool)
+    }
+
+def max_access_level_per_user(matrix):
+    """
+    Compute the highest access level each user holds across all projects.
+
+    :param matrix: The access level matrix returned by `get_access_level_matrix`.
+    :type matrix: dict
+    :return: An array with the maximum access level of each user, indexed like `usernames`.
+    :rtype: numpy.ndarray
+    """
+    max_levels = np.zeros(len(matrix["usernames"]), dtype=np.uint8)
+    np.maximum.at(max_levels, matrix["rows"], matrix["levels"])
+    return max_levels
+
+def count_owners_per_project(matrix):
+    """
+    Count the members with the Owner access level in each project.
+
+    :param matrix: The access level matrix returned by `get_access_level_matrix`.
+    :type matrix: dict
+    :return: An array with the number of Owners of each project, indexed like `projects`.
+    :rtype: numpy.ndarray
+    """
+    is_owner = matrix["levels"] == access_levels["Owner"]
+    return np.bincount(matrix["cols"][is_owner], minlength=len(matrix["projects"]))
+
+def get_access_level_window(matrix, row_start, row_stop, col_start, col_stop):
+    """
+    Extract a dense block of access levels from the sparse access level matrix.
+
+    This function looks up every cell of the requested block at once by searching the
+    sorted flat `keys` of the matrix, so only the visible part of the grid is ever
+    materialized. Cells without a membership are filled with 0 (No access).
+
+    :param matrix: The access level matrix returned by `get_access_level_matrix`.
+    :type matrix: dict
+    :param row_start: The first user row of the block.
+    :type row_start: int
+    :param row_stop: The user row after the last row of the block.
+    :type row_stop: int
+    :param col_start: The first project column of the block.
+    :type col_start: int
+    :param col_stop: The project column after the last column of the block.
+    :type col_stop: int
+    :return: A (rows x columns) array of access levels.
+    :rtype: numpy.ndarray
+    """
+    keys = matrix["keys"]
+    window_keys = np.add.outer(
+        np.arange(row_start, row_stop, dtype=np.int64) * len(matrix["projects"]),
+        np.arange(col_start, col_stop, dtype=np.int64)
+    )
+    if keys.size == 0:
+        return np.zeros(window_keys.shape, dtype=np.uint8)
+
+    positions = np.minimum(np.searchsorted(keys, window_keys), keys.size - 1)
+    return np.where(keys[positions] == window_keys, matrix["levels"][positions], 0).astype(np.uint8)
+
 # Add member to group
 def add_member_to_group_by_username(group_id, username, access_level, gitlab_url, private_token):
     """
@@ -336,9 +1007,7 @@ def add_member_to_group_by_username(group_id, username, access_level, gitlab_url
     user_id = None
     user_search_url = f"{gitlab_url}/api/v4/users?username={username}"
     try:
-        response = requests.get(user_search_url, headers=headers)
-        response.raise_for_status()
-        users = response.json()
+        users = gitlab_get_json(user_search_url, headers)
         if users:
             user_id = users[0]['id']  # Take the first user's ID (if found)
 
@@ -349,7 +1018,7 @@ def add_member_to_group_by_username(group_id, username, access_level, gitlab_url
     if user_id:
         data = {"user_id": user_id, "access_level": access_level}
         try:
-            response = requests.post(api_url, headers=headers, json=data)
+            response = gitlab_write("post", api_url, headers, json=data)
             response.raise_for_status()  # Check for any errors in the API response
 
             return response.json()
@@ -385,15 +1054,12 @@ def delete_group_member_by_username(group_id, username, gitlab_url, private_toke
     headers = {"Authorization": private_token}
 
     try:
-        response = requests.get(api_url, headers=headers)
-        response.raise_for_status()  # Check for any errors in the API response
-
-        members = response.json()
+        members = gitlab_get_json(api_url, headers)
         for member in members:
             if username.lower() == member['username'].lower():
                 member_id = member['id']
                 delete_url = f"{gitlab_url}/api/v4/groups/{group_id}/members/{member_id}"
-                response = requests.delete(delete_url, headers=headers)
+                response = gitlab_write("delete", delete_url, headers)
                 response.raise_for_status()
                 return member
         return None
@@ -426,15 +1092,12 @@ def delete_project_member_by_username(project_id, username, gitlab_url, private_
     headers = {"Authorization": private_token}
 
     try:
-        response = requests.get(api_url, headers=headers)
-        response.raise_for_status()  # Check for any errors in the API response
-
-        members = response.json()
+        members = gitlab_get_json(api_url, headers)
         for member in members:
             if username.lower() == member['username'].lower():
                 member_id = member['id']
                 delete_url = f"{gitlab_url}/api/v4/projects/{project_id}/members/{member_id}"
-                response = requests.delete(delete_url, headers=headers)
+                response = gitlab_write("delete", delete_url, headers)
                 response.raise_for_status()
                 return member
         return None
@@ -471,9 +1134,7 @@ def add_member_to_project_by_username(project_id, username, access_level, gitlab
     user_id = None
     user_search_url = f"{gitlab_url}/api/v4/users?username={username}"
     try:
-        response = requests.get(user_search_url, headers=headers)
-        response.raise_for_status()
-        users = response.json()
+        users = gitlab_get_json(user_search_url, headers)
         if users:
             user_id = users[0]['id']  # Take the first user's ID (if found)
 
@@ -484,7 +1145,7 @@ def add_member_to_project_by_username(project_id, username, access_level, gitlab
     if user_id:
         data = {"user_id": user_id, "access_level": access_level}
         try:
-            response = requests.post(api_url, headers=headers, json=data)
+            response = gitlab_write("post", api_url, headers, json=data)
             response.raise_for_status()  # Check for any errors in the API response
 
             return response.json()
@@ -501,14 +1162,25 @@ def populate_project_dropdown():
     Populate a dropdown menu with the names and IDs of all GitLab projects.
 
     This function retrieves a list of all GitLab projects using the provided GitLab URL
-    and private token by calling the `get_all_projects` function. It then populates the
-    project dropdown menu with the names and IDs of the projects, allowing users to select
-    a project for various operations.
+    and private token by calling the `get_all_projects` function in the background with
+    `run_in_background`. It then populates the project dropdown menu with the names and IDs
+    of the projects with `fill_project_dropdown`, allowing users to select a project for
+    various operations.
 
     :param None
     :return: None
     """
-    all_projects = get_all_projects(gitlab_url, private_token)
+    run_in_background(get_all_projects, fill_project_dropdown, gitlab_url, private_token,
+                      executor=request_executor)
+
+def fill_project_dropdown(all_projects):
+    """
+    Add the projects retrieved by `populate_project_dropdown` to the project dropdown menu.
+
+    :param all_projects: The result of `get_all_projects`.
+    :type all_projects: list[dict] or None
+    :return: None
+    """
     if all_projects:
         for project in all_projects:
             project_name = project['name']
@@ -575,22 +1247,20 @@ def list_group_members(group_id, gitlab_url, private_token):
     headers = {"Authorization": private_token}
 
     try:
-        response = requests.get(api_url, headers=headers)
-        response.raise_for_status()  # Check for any errors in the API response
-
-        return response.json()
+        return gitlab_get_json(api_url, headers)
     except requests.exceptions.RequestException as e:
         print(f"Error: {e}")
         return None
 
 # list members of project
-def list_project_members(project_id, gitlab_url, private_token):
+def list_project_members(project_id, gitlab_url, private_token, inherited=False, all_pages=False):
     """
     Retrieve the list of members in a GitLab project.
 
     This function makes an API request to obtain the list of members in the specified
     GitLab project using the provided project ID, GitLab URL, and private token. It returns
     the list of project members if the request is successful, or None if an error occurs.
+    By default only the direct members on the first page of the listing are retrieved.
 
     :param project_id: The ID of the project.
     :type project_id: int
@@ -598,35 +1268,123 @@ def list_project_members(project_id, gitlab_url, private_token):
     :type gitlab_url: str
     :param private_token: The private token for authentication.
     :type private_token: str
+    :param inherited: Whether to include members inherited from ancestor groups (`/members/all`).
+    :type inherited: bool
+    :param all_pages: Whether to retrieve every page of the listing.
+    :type all_pages: bool
     :return: A list of project members, or None if an error occurs.
     :rtype: list[dict] or None
     """
     api_url = f"{gitlab_url}/api/v4/projects/{project_id}/members"
+    if inherited:
+        api_url = f"{api_url}/all"
     headers = {"Authorization": private_token}
 
     try:
-        response = requests.get(api_url, headers=headers)
-        response.raise_for_status()  # Check for any errors in the API response
-
-        return response.json()
+        if all_pages:
+            return gitlab_get_all_pages(api_url, headers)
+        return gitlab_get_json(api_url, headers)
     except requests.exceptions.RequestException as e:
         print(f"Error: {e}")
         return None
 
 
+def list_members_of_projects(projects, gitlab_url, private_token, inherited=False, all_pages=False):
+    """
+    Retrieve the members of several GitLab projects in parallel.
+
+    This function calls the `list_project_members` function for every project from a pool
+    of worker threads. The number of requests actually in flight is controlled by the
+    adaptive concurrency limiter of `gitlab_request`. Once `stop_requests` is set, the
+    remaining projects are skipped.
+
+    :param projects: The projects, as returned by `get_all_projects`.
+    :type projects: list[dict]
+    :param gitlab_url: The base URL of the GitLab instance.
+    :type gitlab_url: str
+    :param private_token: The private token for authentication.
+    :type private_token: str
+    :param inherited: Whether to include members inherited from ancestor groups.
+    :type inherited: bool
+    :param all_pages: Whether to retrieve every page of each member listing.
+    :type all_pages: bool
+    :return: The list of members of each project (None if an error occurs), in the order of `projects`.
+    :rtype: list[list[dict] or None]
+    """
+    def list_members(project):
+        if stop_requests.is_set():
+            return None
+        return list_project_members(project['id'], gitlab_url, private_token,
+                                    inherited=inherited, all_pages=all_pages)
+
+    with ThreadPoolExecutor(max_workers=rate_limit_max_concurrency) as executor:
+        return list(executor.map(list_members, projects))
+
+def run_in_background(function, callback, *args, executor=None):
+    """
+    Run a function on a background worker thread and pass its result to a callback.
+
+    API requests must not run in Tk callbacks, which would freeze the window while they
+    wait for the network or for the rate limiter. This function submits `function(*args)`
+    to `executor` (`background_executor`, used by long crawls, by default) and polls its
+    future every 100 ms with `root.after`, calling `callback` with the result on the Tk
+    main thread once done.
+
+    :param function: The function to run in the background.
+    :type function: callable
+    :param callback: The function called with the result on the Tk main thread.
+    :type callback: callable
+    :param args: The arguments of `function`.
+    :param executor: The executor to run `function` on.
+    :type executor: concurrent.futures.Executor or None
+    :return: None
+    """
+    future = (executor or background_executor).submit(function, *args)
+
+    def poll():
+        if future.done():
+            callback(future.result())
+        else:
+            root.after(100, poll)
+
+    poll()
+
+def update_request_stats_label():
+    """
+    Show the current concurrency and throughput of API requests, refreshed every second.
+
+    :param None
+    :return: None
+    """
+    stats = get_request_stats()
+    request_stats_label.config(text=f"Requests: {stats['in_flight']}/{stats['concurrency']} in flight, "
+                                    f"{stats['throughput']:.1f}/s, {stats['latency'] * 1000:.0f} ms")
+    root.after(1000, update_request_stats_label)
+
 def exit_program():
     """
     Exit the program and close the GUI window.
 
     This function destroys the main GUI window, effectively closing the program when called.
+    Background work that has not started yet is cancelled, and `stop_requests` makes
+    running work stop sending requests, so the program does not wait for it to finish.
 
     :param None
     :return: None
     """
+    stop_requests.set()
+    with rate_limiter["condition"]:
+        rate_limiter["condition"].notify_all()  # Wake up requests waiting for a slot
+    background_executor.shutdown(wait=False, cancel_futures=True)
+    request_executor.shutdown(wait=False, cancel_futures=True)
     root.destroy()
 
+background_executor = ThreadPoolExecutor(max_workers=1)  # Long crawls
+request_executor = ThreadPoolExecutor(max_workers=1)  # Requests of the other GUI actions, in order
+
 root = tk.Tk()
 root.title("GitLab API Interaction")
+root.protocol("WM_DELETE_WINDOW", exit_program)
 
 main_frame = tk.Frame(root)
 main_frame.pack(padx=20, pady=20)
@@ -651,6 +1409,9 @@ view_access_button.grid(row=8, column=0, columnspan=2, padx=5, pady=10)
 show_unique_usernames_button = tk.Button(menu_frame, text="Show Unique Usernames", command=show_unique_usernames)
 show_unique_usernames_button.grid(row=4, column=0, columnspan=2, padx=5, pady=5)
 
+view_access_matrix_button = tk.Button(menu_frame, text="View Access Matrix", command=show_access_matrix)
+view_access_matrix_button.grid(row=5, column=0, columnspan=2, padx=5, pady=5)
+
 # Member Actions
 action_frame = tk.Frame(main_frame)
 action_frame.pack()
@@ -700,6 +1461,10 @@ result_frame.pack()
 result_text = tk.Text(result_frame, width=50, height=10, state=tk.DISABLED)
 result_text.pack()
 
+request_stats_label = tk.Label(result_frame, anchor="w")
+request_stats_label.pack(fill=tk.X)
+update_request_stats_label()
+
 # Exit
 exit_button = tk.Button(main_frame, text="Exit", command=exit_program)
 exit_button.pack(pady=10)